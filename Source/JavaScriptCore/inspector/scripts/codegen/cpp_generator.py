@@ -43,6 +43,10 @@ _PRIMITIVE_TO_CPP_NAME_MAP = {
     'any': 'Inspector::InspectorValue'
 }
 
+# Memoization for results that only depend on immutable model objects.
+_CPP_PROTOCOL_TYPE_CACHE = {}
+_ASSERTION_METHOD_CACHE = {}
+
 # This class contains extra static methods used for generation, but does
 # not participate in any inheritance hierarchy. File generators should
 # extend the generic "Generator" class instead.
@@ -92,6 +96,15 @@ class CppGenerator:
     # Generate type representations for various situations.
     @staticmethod
     def cpp_protocol_type_for_type(_type):
+        try:
+            return _CPP_PROTOCOL_TYPE_CACHE[_type]
+        except KeyError:
+            result = CppGenerator._cpp_protocol_type_for_type(_type)
+            _CPP_PROTOCOL_TYPE_CACHE[_type] = result
+            return result
+
+    @staticmethod
+    def _cpp_protocol_type_for_type(_type):
         if isinstance(_type, ObjectType) and len(_type.members) == 0:
             return 'Inspector::InspectorObject'
         if isinstance(_type, ArrayType):
@@ -285,6 +298,15 @@ class CppGenerator:
 
     @staticmethod
     def cpp_assertion_method_for_type_member(type_member, object_declaration):
+        try:
+            return _ASSERTION_METHOD_CACHE[(type_member, object_declaration)]
+        except KeyError:
+            result = CppGenerator._cpp_assertion_method_for_type_member(type_member, object_declaration)
+            _ASSERTION_METHOD_CACHE[(type_member, object_declaration)] = result
+            return result
+
+    @staticmethod
+    def _cpp_assertion_method_for_type_member(type_member, object_declaration):
 
         def assertion_method_for_type(_type):
             return 'BindingTraits<%s>::assertValueHasExpectedType' % CppGenerator.cpp_protocol_type_for_type(_type)
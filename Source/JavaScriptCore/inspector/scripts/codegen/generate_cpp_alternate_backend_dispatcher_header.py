@@ -30,12 +30,24 @@ import string
 import re
 from string import Template
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from cpp_generator import CppGenerator
 from cpp_generator_templates import CppGeneratorTemplates as CppTemplates
 from generator import Generator
 
 log = logging.getLogger('global')
 
+_NON_WORD_RE = re.compile(r'\W+')
+
+# Parsing a Template is not cheap, so only do it once per process.
+_HEADER_PRELUDE_TEMPLATE = Template(CppTemplates.AlternateDispatchersHeaderPrelude)
+_HEADER_POSTLUDE_TEMPLATE = Template(CppTemplates.AlternateDispatchersHeaderPostlude)
+_DOMAIN_HANDLER_INTERFACE_DECLARATION_TEMPLATE = Template(CppTemplates.AlternateBackendDispatcherHeaderDomainHandlerInterfaceDeclaration)
+
 
 class CppAlternateBackendDispatcherHeaderGenerator(Generator):
     def __init__(self, model, input_filepath):
@@ -52,17 +64,21 @@ class CppAlternateBackendDispatcherHeaderGenerator(Generator):
         ]
 
         header_args = {
-            'headerGuardString': re.sub('\W+', '_', self.output_filename()),
-            'includes': '\n'.join(['#include ' + header for header in headers]),
+            'headerGuardString': _NON_WORD_RE.sub('_', self.output_filename()),
+            'includes': '\n'.join('#include ' + header for header in headers),
         }
 
         domains = self.domains_to_generate()
-        sections = []
-        sections.append(self.generate_license())
-        sections.append(Template(CppTemplates.AlternateDispatchersHeaderPrelude).substitute(None, **header_args))
-        sections.append('\n'.join(filter(None, map(self._generate_handler_declarations_for_domain, domains))))
-        sections.append(Template(CppTemplates.AlternateDispatchersHeaderPostlude).substitute(None, **header_args))
-        return '\n\n'.join(sections)
+        generate_handler_declarations = self._generate_handler_declarations_for_domain
+        buf = StringIO()
+        buf.write(self.generate_license())
+        buf.write('\n\n')
+        buf.write(_HEADER_PRELUDE_TEMPLATE.substitute(header_args))
+        buf.write('\n\n')
+        buf.write('\n'.join(section for section in (generate_handler_declarations(domain) for domain in domains) if section))
+        buf.write('\n\n')
+        buf.write(_HEADER_POSTLUDE_TEMPLATE.substitute(header_args))
+        return buf.getvalue()
 
     def _generate_handler_declarations_for_domain(self, domain):
         if not domain.commands:
@@ -77,17 +93,10 @@ class CppAlternateBackendDispatcherHeaderGenerator(Generator):
             'commandDeclarations': '\n'.join(command_declarations),
         }
 
-        return self.wrap_with_guard_for_domain(domain, Template(CppTemplates.AlternateBackendDispatcherHeaderDomainHandlerInterfaceDeclaration).substitute(None, **handler_args))
+        return self.wrap_with_guard_for_domain(domain, _DOMAIN_HANDLER_INTERFACE_DECLARATION_TEMPLATE.substitute(handler_args))
 
     def _generate_handler_declaration_for_command(self, command):
-        lines = []
+        cpp_type_for_parameter = CppGenerator.cpp_type_for_unchecked_formal_in_parameter
         parameters = ['long callId']
-        for _parameter in command.call_parameters:
-            parameters.append('%s in_%s' % (CppGenerator.cpp_type_for_unchecked_formal_in_parameter(_parameter), _parameter.parameter_name))
-
-        command_args = {
-            'commandName': command.command_name,
-            'parameters': ', '.join(parameters),
-        }
-        lines.append('    virtual void %(commandName)s(%(parameters)s) = 0;' % command_args)
-        return '\n'.join(lines)
+        parameters.extend('%s in_%s' % (cpp_type_for_parameter(_parameter), _parameter.parameter_name) for _parameter in command.call_parameters)
+        return '    virtual void %s(%s) = 0;' % (command.command_name, ', '.join(parameters))
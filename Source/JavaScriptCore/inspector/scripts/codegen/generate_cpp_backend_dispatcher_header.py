@@ -58,7 +58,7 @@ class CppBackendDispatcherHeaderGenerator(Generator):
 
         header_args = {
             'headerGuardString': re.sub('\W+', '_', self.output_filename()),
-            'includes': '\n'.join(['#include ' + header for header in headers]),
+            'includes': '\n'.join('#include ' + header for header in headers),
             'typedefs': '\n'.join(['typedef %s %s;' % typedef for typedef in typedefs]),
         }
 
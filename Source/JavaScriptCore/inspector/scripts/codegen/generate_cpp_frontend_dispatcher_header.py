@@ -56,7 +56,7 @@ class CppFrontendDispatcherHeaderGenerator(Generator):
 
         header_args = {
             'headerGuardString': re.sub('\W+', '_', self.output_filename()),
-            'includes': '\n'.join(['#include ' + header for header in headers]),
+            'includes': '\n'.join('#include ' + header for header in headers),
             'typedefs': 'class FrontendRouter;',
         }
 
@@ -55,7 +55,7 @@ class CppFrontendDispatcherImplementationGenerator(Generator):
 
         header_args = {
             'primaryInclude': '"InspectorFrontendDispatchers.h"',
-            'secondaryIncludes': "\n".join(['#include %s' % header for header in secondary_headers]),
+            'secondaryIncludes': "\n".join('#include %s' % header for header in secondary_headers),
         }
 
         sections = []
@@ -58,7 +58,7 @@ class CppProtocolTypesHeaderGenerator(Generator):
 
         header_args = {
             'headerGuardString': re.sub('\W+', '_', self.output_filename()),
-            'includes': '\n'.join(['#include ' + header for header in sorted(headers)]),
+            'includes': '\n'.join('#include ' + header for header in sorted(headers)),
             'typedefs': '',
         }
 
@@ -26,9 +26,15 @@
 
 
 import logging
+import operator
 import string
 from string import Template
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from cpp_generator import CppGenerator
 from cpp_generator_templates import CppGeneratorTemplates as CppTemplates
 from generator import Generator, ucfirst
@@ -36,6 +42,39 @@ from models import AliasedType, ArrayType, EnumType, ObjectType
 
 log = logging.getLogger('global')
 
+_MEMBER_NAME_KEY = operator.attrgetter('member_name')
+
+# Enums at least this wide get a HashSet membership check instead of a
+# linear chain of string compares in their shape assertion.
+_ENUM_ASSERTION_HASH_SET_THRESHOLD = 4
+
+# Parsing a Template is not cheap, so only do it once per process.
+_IMPLEMENTATION_PRELUDE_TEMPLATE = Template(CppTemplates.ImplementationPrelude)
+_IMPLEMENTATION_POSTLUDE_TEMPLATE = Template(CppTemplates.ImplementationPostlude)
+_PROTOCOL_OBJECT_RUNTIME_CAST_TEMPLATE = Template(CppTemplates.ProtocolObjectRuntimeCast)
+
+# Constant boilerplate shared by every emitted shape assertion.
+_OBJECT_ASSERTION_PROLOGUE = """#if !ASSERT_DISABLED
+void BindingTraits<%s>::assertValueHasExpectedType(Inspector::InspectorValue* value)
+{
+    ASSERT_ARG(value, value);
+    RefPtr<InspectorObject> object;
+    bool castSucceeded = value->asObject(object);
+    ASSERT_UNUSED(castSucceeded, castSucceeded);
+"""
+
+_ENUM_ASSERTION_PROLOGUE = """#if !ASSERT_DISABLED
+void %s(Inspector::InspectorValue* value)
+{
+    ASSERT_ARG(value, value);
+    String result;
+    bool castSucceeded = value->asString(result);
+    ASSERT(castSucceeded);
+"""
+
+_ASSERTION_EPILOGUE = """}
+#endif // !ASSERT_DISABLED"""
+
 
 class CppProtocolTypesImplementationGenerator(Generator):
     def __init__(self, model, input_filepath):
@@ -49,27 +88,45 @@ class CppProtocolTypesImplementationGenerator(Generator):
         self.calculate_types_requiring_shape_assertions(domains)
 
         secondary_headers = ['<wtf/text/CString.h>']
+        if self._uses_enum_value_hash_sets(domains):
+            secondary_headers = ['<wtf/HashSet.h>', '<wtf/NeverDestroyed.h>', '<wtf/text/CString.h>', '<wtf/text/StringHash.h>']
 
         header_args = {
             'primaryInclude': '"InspectorProtocolObjects.h"',
-            'secondaryIncludes': "\n".join(['#include %s' % header for header in secondary_headers]),
+            'secondaryIncludes': "\n".join('#include %s' % header for header in secondary_headers),
         }
 
-        sections = []
-        sections.append(self.generate_license())
-        sections.append(Template(CppTemplates.ImplementationPrelude).substitute(None, **header_args))
-        sections.append('namespace Protocol {')
-        sections.append(self._generate_enum_mapping())
-        sections.append(self._generate_open_field_names())
-        builder_sections = map(self._generate_builders_for_domain, domains)
-        sections.extend(filter(lambda section: len(section) > 0, builder_sections))
-        sections.append('} // namespace Protocol')
-        sections.append(Template(CppTemplates.ImplementationPostlude).substitute(None, **header_args))
-
-        return "\n\n".join(sections)
+        buf = StringIO()
+        buf.write(self.generate_license())
+        buf.write('\n\n')
+        buf.write(_IMPLEMENTATION_PRELUDE_TEMPLATE.substitute(header_args))
+        buf.write('\n\nnamespace Protocol {\n\n')
+        buf.write(self._generate_enum_mapping())
+        buf.write('\n\n')
+        buf.write(self._generate_open_field_names())
+        generate_builders = self._generate_builders_for_domain
+        for domain in domains:
+            section = generate_builders(domain)
+            if section:
+                buf.write('\n\n')
+                buf.write(section)
+        buf.write('\n\n} // namespace Protocol\n\n')
+        buf.write(_IMPLEMENTATION_POSTLUDE_TEMPLATE.substitute(header_args))
+
+        return buf.getvalue()
 
     # Private methods.
 
+    def _uses_enum_value_hash_sets(self, domains):
+        for domain in domains:
+            for type_declaration in domain.type_declarations:
+                if not self.type_needs_shape_assertions(type_declaration.type):
+                    continue
+                for type_member in type_declaration.type_members:
+                    if isinstance(type_member.type, EnumType) and len(type_member.type.enum_values()) >= _ENUM_ASSERTION_HASH_SET_THRESHOLD:
+                        return True
+        return False
+
     def _generate_enum_mapping(self):
         lines = []
         lines.append('static const char* const enum_constant_values[] = {')
@@ -83,27 +140,39 @@ class CppProtocolTypesImplementationGenerator(Generator):
 
     def _generate_open_field_names(self):
         lines = []
+        append = lines.append
+        uc_first = ucfirst
+        type_has_open_fields = Generator.type_has_open_fields
         for domain in self.domains_to_generate():
-            for type_declaration in filter(lambda decl: Generator.type_has_open_fields(decl.type), domain.type_declarations):
-                for type_member in sorted(type_declaration.type_members, key=lambda member: member.member_name):
-                    field_name = '::'.join(['Inspector', 'Protocol', domain.domain_name, ucfirst(type_declaration.type_name), ucfirst(type_member.member_name)])
-                    lines.append('const char* %s = "%s";' % (field_name, type_member.member_name))
+            domain_name = domain.domain_name
+            for type_declaration in domain.type_declarations:
+                if not type_has_open_fields(type_declaration.type):
+                    continue
+                type_name = uc_first(type_declaration.type_name)
+                for type_member in sorted(type_declaration.type_members, key=_MEMBER_NAME_KEY):
+                    member_name = type_member.member_name
+                    append('const char* Inspector::Protocol::%s::%s::%s = "%s";' % (domain_name, type_name, uc_first(member_name), member_name))
 
         return '\n'.join(lines)
 
     def _generate_builders_for_domain(self, domain):
         sections = []
-        declarations_to_generate = filter(lambda decl: self.type_needs_shape_assertions(decl.type), domain.type_declarations)
+        append = sections.append
+        needs_shape_assertions = self.type_needs_shape_assertions
+        needs_runtime_casts = Generator.type_needs_runtime_casts
+
+        for type_declaration in domain.type_declarations:
+            if not needs_shape_assertions(type_declaration.type):
+                continue
 
-        for type_declaration in declarations_to_generate:
             for type_member in type_declaration.type_members:
                 if isinstance(type_member.type, EnumType):
-                    sections.append(self._generate_assertion_for_enum(type_member, type_declaration))
+                    append(self._generate_assertion_for_enum(type_member, type_declaration))
 
             if isinstance(type_declaration.type, ObjectType):
-                sections.append(self._generate_assertion_for_object_declaration(type_declaration))
-                if Generator.type_needs_runtime_casts(type_declaration.type):
-                    sections.append(self._generate_runtime_cast_for_object_declaration(type_declaration))
+                append(self._generate_assertion_for_object_declaration(type_declaration))
+                if needs_runtime_casts(type_declaration.type):
+                    append(self._generate_runtime_cast_for_object_declaration(type_declaration))
 
         return '\n\n'.join(sections)
 
@@ -111,73 +180,60 @@ class CppProtocolTypesImplementationGenerator(Generator):
         args = {
             'objectType': CppGenerator.cpp_protocol_type_for_type(object_declaration.type)
         }
-        return Template(CppTemplates.ProtocolObjectRuntimeCast).substitute(None, **args)
+        return _PROTOCOL_OBJECT_RUNTIME_CAST_TEMPLATE.substitute(args)
 
     def _generate_assertion_for_object_declaration(self, object_declaration):
-        required_members = filter(lambda member: not member.is_optional, object_declaration.type_members)
-        optional_members = filter(lambda member: member.is_optional, object_declaration.type_members)
+        required_members = [member for member in object_declaration.type_members if not member.is_optional]
+        optional_members = [member for member in object_declaration.type_members if member.is_optional]
         should_count_properties = not Generator.type_has_open_fields(object_declaration.type)
-        lines = []
 
-        lines.append('#if !ASSERT_DISABLED')
-        lines.append('void BindingTraits<%s>::assertValueHasExpectedType(Inspector::InspectorValue* value)' % (CppGenerator.cpp_protocol_type_for_type(object_declaration.type)))
-        lines.append("""{
-    ASSERT_ARG(value, value);
-    RefPtr<InspectorObject> object;
-    bool castSucceeded = value->asObject(object);
-    ASSERT_UNUSED(castSucceeded, castSucceeded);""")
+        buf = StringIO()
+        write = buf.write
+        assertion_method_for_member = CppGenerator.cpp_assertion_method_for_type_member
+        write(_OBJECT_ASSERTION_PROLOGUE % (CppGenerator.cpp_protocol_type_for_type(object_declaration.type)))
         for type_member in required_members:
-            args = {
-                'memberName': type_member.member_name,
-                'assertMethod': CppGenerator.cpp_assertion_method_for_type_member(type_member, object_declaration)
-            }
-
-            lines.append("""    {
-        InspectorObject::iterator %(memberName)sPos = object->find(ASCIILiteral("%(memberName)s"));
-        ASSERT(%(memberName)sPos != object->end());
-        %(assertMethod)s(%(memberName)sPos->value.get());
-    }""" % args)
+            member_name = type_member.member_name
+            assert_method = assertion_method_for_member(type_member, object_declaration)
+            write("""    {
+        InspectorObject::iterator %sPos = object->find(ASCIILiteral("%s"));
+        ASSERT(%sPos != object->end());
+        %s(%sPos->value.get());
+    }
+""" % (member_name, member_name, member_name, assert_method, member_name))
 
         if should_count_properties:
-            lines.append('')
-            lines.append('    int foundPropertiesCount = %s;' % len(required_members))
+            write('\n')
+            write('    int foundPropertiesCount = %s;\n' % len(required_members))
 
         for type_member in optional_members:
-            args = {
-                'memberName': type_member.member_name,
-                'assertMethod': CppGenerator.cpp_assertion_method_for_type_member(type_member, object_declaration)
-            }
-
-            lines.append("""    {
-        InspectorObject::iterator %(memberName)sPos = object->find(ASCIILiteral("%(memberName)s"));
-        if (%(memberName)sPos != object->end()) {
-            %(assertMethod)s(%(memberName)sPos->value.get());""" % args)
+            member_name = type_member.member_name
+            assert_method = assertion_method_for_member(type_member, object_declaration)
+            write("""    {
+        InspectorObject::iterator %sPos = object->find(ASCIILiteral("%s"));
+        if (%sPos != object->end()) {
+            %s(%sPos->value.get());
+""" % (member_name, member_name, member_name, assert_method, member_name))
 
             if should_count_properties:
-                lines.append('            ++foundPropertiesCount;')
-            lines.append('        }')
-            lines.append('    }')
+                write('            ++foundPropertiesCount;\n')
+            write('        }\n')
+            write('    }\n')
 
         if should_count_properties:
-            lines.append('    if (foundPropertiesCount != object->size())')
-            lines.append('        FATAL("Unexpected properties in object: %s\\n", object->toJSONString().ascii().data());')
-        lines.append('}')
-        lines.append('#endif // !ASSERT_DISABLED')
-        return '\n'.join(lines)
+            write('    if (foundPropertiesCount != object->size())\n')
+            write('        FATAL("Unexpected properties in object: %s\\n", object->toJSONString().ascii().data());\n')
+        write(_ASSERTION_EPILOGUE)
+        return buf.getvalue()
 
     def _generate_assertion_for_enum(self, enum_member, object_declaration):
-        lines = []
-        lines.append('#if !ASSERT_DISABLED')
-        lines.append('void %s(Inspector::InspectorValue* value)' % CppGenerator.cpp_assertion_method_for_type_member(enum_member, object_declaration))
-        lines.append('{')
-        lines.append('    ASSERT_ARG(value, value);')
-        lines.append('    String result;')
-        lines.append('    bool castSucceeded = value->asString(result);')
-        lines.append('    ASSERT(castSucceeded);')
-
-        assert_condition = ' || '.join(['result == "%s"' % enum_value for enum_value in enum_member.type.enum_values()])
-        lines.append('    ASSERT(%s);' % assert_condition)
-        lines.append('}')
-        lines.append('#endif // !ASSERT_DISABLED')
-
-        return '\n'.join(lines)
+        enum_values = enum_member.type.enum_values()
+        if len(enum_values) < _ENUM_ASSERTION_HASH_SET_THRESHOLD:
+            assert_condition = ' || '.join('result == "%s"' % enum_value for enum_value in enum_values)
+            body = '    ASSERT(%s);\n' % assert_condition
+        else:
+            allowed_values = ', '.join('ASCIILiteral("%s")' % enum_value for enum_value in enum_values)
+            body = ('    static NeverDestroyed<HashSet<String>> allowedValues(HashSet<String>({ %s }));\n'
+                    '    ASSERT(allowedValues.get().contains(result));\n') % allowed_values
+
+        prologue = _ENUM_ASSERTION_PROLOGUE % CppGenerator.cpp_assertion_method_for_type_member(enum_member, object_declaration)
+        return prologue + body + _ASSERTION_EPILOGUE
@@ -29,6 +29,11 @@ import logging
 import string
 from string import Template
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from generator import Generator, ucfirst
 from generator_templates import GeneratorTemplates as Templates
 from models import EnumType
@@ -36,6 +41,11 @@ from models import EnumType
 log = logging.getLogger('global')
 
 
+def _generate_parameter_object(parameter, _js_name=Generator.js_name_for_parameter_type):
+    optional_string = "true" if parameter.is_optional else "false"
+    return '{"name": "%s", "type": "%s", "optional": %s}' % (parameter.parameter_name, _js_name(parameter.type), optional_string)
+
+
 class JSBackendCommandsGenerator(Generator):
     def __init__(self, model, input_filepath):
         Generator.__init__(self, model, input_filepath)
@@ -44,85 +54,84 @@ class JSBackendCommandsGenerator(Generator):
         return "InspectorBackendCommands.js"
 
     def domains_to_generate(self):
-        def should_generate_domain(domain):
-            domain_enum_types = filter(lambda declaration: isinstance(declaration.type, EnumType), domain.type_declarations)
-            return len(domain.commands) > 0 or len(domain.events) > 0 or len(domain_enum_types) > 0
+        if not hasattr(self, "_js_domains_to_generate"):
+            def should_generate_domain(domain):
+                if len(domain.commands) > 0 or len(domain.events) > 0:
+                    return True
+                return any(isinstance(declaration.type, EnumType) for declaration in domain.type_declarations)
+
+            self._js_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate_domain(domain)]
 
-        return filter(should_generate_domain, Generator.domains_to_generate(self))
+        return self._js_domains_to_generate
 
     def generate_output(self):
-        sections = []
-        sections.append(self.generate_license())
-        sections.extend(map(self.generate_domain, self.domains_to_generate()))
-        return "\n\n".join(sections)
+        buf = StringIO()
+        buf.write(self.generate_license())
+        for domain in self.domains_to_generate():
+            buf.write('\n\n')
+            buf.write(self.generate_domain(domain))
+        return buf.getvalue()
 
     def generate_domain(self, domain):
         lines = []
+        append = lines.append
+        styled = Generator.stylized_name_for_enum_value
         args = {
             'domain': domain.domain_name
         }
 
-        lines.append('// %(domain)s.' % args)
+        append('// %(domain)s.' % args)
 
-        has_async_commands = any(map(lambda command: command.is_async, domain.commands))
+        has_async_commands = any(command.is_async for command in domain.commands)
         if len(domain.events) > 0 or has_async_commands:
-            lines.append('InspectorBackend.register%(domain)sDispatcher = InspectorBackend.registerDomainDispatcher.bind(InspectorBackend, "%(domain)s");' % args)
+            append('InspectorBackend.register%(domain)sDispatcher = InspectorBackend.registerDomainDispatcher.bind(InspectorBackend, "%(domain)s");' % args)
 
+        # Walk each declaration once, emitting named and anonymous enum registrations as they appear.
         for declaration in domain.type_declarations:
             if declaration.type.is_enum():
                 enum_args = {
                     'domain': domain.domain_name,
                     'enumName': declaration.type_name,
-                    'enumMap': ", ".join(['%s: "%s"' % (Generator.stylized_name_for_enum_value(enum_value), enum_value) for enum_value in declaration.type.enum_values()])
+                    'enumMap': ", ".join('%s: "%s"' % (styled(enum_value), enum_value) for enum_value in declaration.type.enum_values())
                 }
-                lines.append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
+                append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
 
-            def is_anonymous_enum_member(type_member):
-                return isinstance(type_member.type, EnumType) and type_member.type.is_anonymous
-
-            for _member in filter(is_anonymous_enum_member, declaration.type_members):
+            for _member in declaration.type_members:
+                if not isinstance(_member.type, EnumType) or not _member.type.is_anonymous:
+                    continue
                 enum_args = {
                     'domain': domain.domain_name,
                     'enumName': '%s%s' % (declaration.type_name, ucfirst(_member.member_name)),
-                    'enumMap': ", ".join(['%s: "%s"' % (Generator.stylized_name_for_enum_value(enum_value), enum_value) for enum_value in _member.type.enum_values()])
+                    'enumMap': ", ".join('%s: "%s"' % (styled(enum_value), enum_value) for enum_value in _member.type.enum_values())
                 }
-                lines.append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
-
-        def is_anonymous_enum_param(param):
-            return isinstance(param.type, EnumType) and param.type.is_anonymous
+                append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
 
         for event in domain.events:
-            for param in filter(is_anonymous_enum_param, event.event_parameters):
+            for param in event.event_parameters:
+                if not isinstance(param.type, EnumType) or not param.type.is_anonymous:
+                    continue
                 enum_args = {
                     'domain': domain.domain_name,
                     'enumName': '%s%s' % (ucfirst(event.event_name), ucfirst(param.parameter_name)),
-                    'enumMap': ", ".join(['%s: "%s"' % (Generator.stylized_name_for_enum_value(enum_value), enum_value) for enum_value in param.type.enum_values()])
+                    'enumMap': ", ".join('%s: "%s"' % (styled(enum_value), enum_value) for enum_value in param.type.enum_values())
                 }
-                lines.append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
+                append('InspectorBackend.registerEnum("%(domain)s.%(enumName)s", {%(enumMap)s});' % enum_args)
 
             event_args = {
                 'domain': domain.domain_name,
                 'eventName': event.event_name,
                 'params': ", ".join(['"%s"' % parameter.parameter_name for parameter in event.event_parameters])
             }
-            lines.append('InspectorBackend.registerEvent("%(domain)s.%(eventName)s", [%(params)s]);' % event_args)
+            append('InspectorBackend.registerEvent("%(domain)s.%(eventName)s", [%(params)s]);' % event_args)
 
         for command in domain.commands:
-            def generate_parameter_object(parameter):
-                optional_string = "true" if parameter.is_optional else "false"
-                pairs = []
-                pairs.append('"name": "%s"' % parameter.parameter_name)
-                pairs.append('"type": "%s"' % Generator.js_name_for_parameter_type(parameter.type))
-                pairs.append('"optional": %s' % optional_string)
-                return "{%s}" % ", ".join(pairs)
-
             command_args = {
                 'domain': domain.domain_name,
                 'commandName': command.command_name,
-                'callParams': ", ".join([generate_parameter_object(parameter) for parameter in command.call_parameters]),
-                'returnParams': ", ".join(['"%s"' % parameter.parameter_name for parameter in command.return_parameters]),
+                'callParams': ", ".join(_generate_parameter_object(parameter) for parameter in command.call_parameters),
+                'returnParams': ", ".join('"%s"' % parameter.parameter_name for parameter in command.return_parameters),
             }
-            lines.append('InspectorBackend.registerCommand("%(domain)s.%(commandName)s", [%(callParams)s], [%(returnParams)s]);' % command_args)
+            append('InspectorBackend.registerCommand("%(domain)s.%(commandName)s", [%(callParams)s], [%(returnParams)s]);' % command_args)
 
         if domain.commands or domain.events:
             activate_args = {
@@ -130,8 +139,8 @@ class JSBackendCommandsGenerator(Generator):
                 'availability': domain.availability,
             }
             if domain.availability:
-                lines.append('InspectorBackend.activateDomain("%(domain)s", "%(availability)s");' % activate_args)
+                append('InspectorBackend.activateDomain("%(domain)s", "%(availability)s");' % activate_args)
             else:
-                lines.append('InspectorBackend.activateDomain("%(domain)s");' % activate_args)
+                append('InspectorBackend.activateDomain("%(domain)s");' % activate_args)
 
         return "\n".join(lines)
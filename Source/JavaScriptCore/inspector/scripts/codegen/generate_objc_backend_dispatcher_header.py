@@ -47,7 +47,10 @@ class ObjCBackendDispatcherHeaderGenerator(Generator):
         return '%sBackendDispatchers.h' % ObjCGenerator.OBJC_PREFIX
 
     def domains_to_generate(self):
-        return filter(ObjCGenerator.should_generate_domain_command_handler_filter(self.model()), Generator.domains_to_generate(self))
+        if not hasattr(self, "_filtered_domains_to_generate"):
+            should_generate = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
+            self._filtered_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate(domain)]
+        return self._filtered_domains_to_generate
 
     def generate_output(self):
         headers = [
@@ -57,7 +60,7 @@ class ObjCBackendDispatcherHeaderGenerator(Generator):
 
         header_args = {
             'headerGuardString': re.sub('\W+', '_', self.output_filename()),
-            'includes': '\n'.join(['#include ' + header for header in headers]),
+            'includes': '\n'.join('#include ' + header for header in headers),
             'forwardDeclarations': self._generate_objc_forward_declarations(),
         }
 
@@ -30,6 +30,11 @@ import string
 import re
 from string import Template
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from cpp_generator import CppGenerator
 from generator import Generator
 from models import PrimitiveType, EnumType, AliasedType, Frameworks
@@ -38,6 +43,25 @@ from objc_generator_templates import ObjCGeneratorTemplates as ObjCTemplates
 
 log = logging.getLogger('global')
 
+# Primitive protocol types that are passed indirectly to the delegate.
+_INDIRECT_PRIMITIVE_NAMES = frozenset(('array', 'any', 'object'))
+
+# Parsing a Template is not cheap, so only do it once per process.
+_IMPLEMENTATION_PRELUDE_TEMPLATE = Template(ObjCTemplates.BackendDispatcherImplementationPrelude)
+_IMPLEMENTATION_POSTLUDE_TEMPLATE = Template(ObjCTemplates.BackendDispatcherImplementationPostlude)
+_DOMAIN_HANDLER_IMPLEMENTATION_TEMPLATE = Template(ObjCTemplates.BackendDispatcherHeaderDomainHandlerImplementation)
+
+
+def _in_param_expression(param_name, parameter):
+    _type = parameter.type
+    if isinstance(_type, AliasedType):
+        _type = _type.aliased_type  # Fall through to enum or primitive.
+    if isinstance(_type, EnumType):
+        _type = _type.primitive_type  # Fall through to primitive.
+    if isinstance(_type, PrimitiveType) and _type.raw_name() not in _INDIRECT_PRIMITIVE_NAMES:
+        return '*%s' % param_name if parameter.is_optional else param_name
+    return '&%s' % param_name if not parameter.is_optional else param_name
+
 
 class ObjCConfigurationImplementationGenerator(Generator):
     def __init__(self, model, input_filepath):
@@ -47,7 +71,10 @@ class ObjCConfigurationImplementationGenerator(Generator):
         return '%sBackendDispatchers.mm' % ObjCGenerator.OBJC_PREFIX
 
     def domains_to_generate(self):
-        return filter(ObjCGenerator.should_generate_domain_command_handler_filter(self.model()), Generator.domains_to_generate(self))
+        if not hasattr(self, "_filtered_domains_to_generate"):
+            should_generate = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
+            self._filtered_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate(domain)]
+        return self._filtered_domains_to_generate
 
     def generate_output(self):
         secondary_headers = [
@@ -58,15 +85,15 @@ class ObjCConfigurationImplementationGenerator(Generator):
 
         header_args = {
             'primaryInclude': '"%sBackendDispatchers.h"' % ObjCGenerator.OBJC_PREFIX,
-            'secondaryIncludes': '\n'.join(['#include %s' % header for header in secondary_headers]),
+            'secondaryIncludes': '\n'.join('#include %s' % header for header in secondary_headers),
         }
 
         domains = self.domains_to_generate()
         sections = []
         sections.append(self.generate_license())
-        sections.append(Template(ObjCTemplates.BackendDispatcherImplementationPrelude).substitute(None, **header_args))
+        sections.append(_IMPLEMENTATION_PRELUDE_TEMPLATE.substitute(header_args))
         sections.extend(map(self._generate_handler_implementation_for_domain, domains))
-        sections.append(Template(ObjCTemplates.BackendDispatcherImplementationPostlude).substitute(None, **header_args))
+        sections.append(_IMPLEMENTATION_POSTLUDE_TEMPLATE.substitute(header_args))
         return '\n\n'.join(sections)
 
     def _generate_handler_implementation_for_domain(self, domain):
@@ -77,13 +104,14 @@ class ObjCConfigurationImplementationGenerator(Generator):
         for command in domain.commands:
             command_declarations.append(self._generate_handler_implementation_for_command(domain, command))
 
-        return '\n'.join(command_declarations)
+        # Wrap the feature guard around the whole domain rather than around
+        # each command, so the guard text is substituted once per domain.
+        return self.wrap_with_guard_for_domain(domain, '\n'.join(command_declarations))
 
     def _generate_handler_implementation_for_command(self, domain, command):
-        lines = []
+        cpp_type_for_parameter = CppGenerator.cpp_type_for_unchecked_formal_in_parameter
         parameters = ['long requestId']
-        for parameter in command.call_parameters:
-            parameters.append('%s in_%s' % (CppGenerator.cpp_type_for_unchecked_formal_in_parameter(parameter), parameter.parameter_name))
+        parameters.extend('%s in_%s' % (cpp_type_for_parameter(parameter), parameter.parameter_name) for parameter in command.call_parameters)
 
         command_args = {
             'domainName': domain.domain_name,
@@ -94,79 +122,77 @@ class ObjCConfigurationImplementationGenerator(Generator):
             'invocation': self._generate_invocation_for_command(domain, command),
         }
 
-        return self.wrap_with_guard_for_domain(domain, Template(ObjCTemplates.BackendDispatcherHeaderDomainHandlerImplementation).substitute(None, **command_args))
+        return _DOMAIN_HANDLER_IMPLEMENTATION_TEMPLATE.substitute(command_args)
 
     def _generate_success_block_for_command(self, domain, command):
-        lines = []
+        buf = StringIO()
+        write = buf.write
+        objc_prefix = ObjCGenerator.OBJC_PREFIX
+        objc_identifier = ObjCGenerator.identifier_to_objc_identifier
+        is_objc_pointer_type = ObjCGenerator.is_type_objc_pointer_type
+        objc_array_class_for_type = ObjCGenerator.objc_class_for_array_type
 
         if command.return_parameters:
             success_block_parameters = []
             for parameter in command.return_parameters:
                 objc_type = ObjCGenerator.objc_type_for_param(domain, command.command_name, parameter)
-                var_name = ObjCGenerator.identifier_to_objc_identifier(parameter.parameter_name)
+                var_name = objc_identifier(parameter.parameter_name)
                 success_block_parameters.append(join_type_and_name(objc_type, var_name))
-            lines.append('    id successCallback = ^(%s) {' % ', '.join(success_block_parameters))
+            write('    id successCallback = ^(%s) {\n' % ', '.join(success_block_parameters))
         else:
-            lines.append('    id successCallback = ^{')
+            write('    id successCallback = ^{\n')
 
         if command.return_parameters:
-            lines.append('        Ref<InspectorObject> resultObject = InspectorObject::create();')
-
-            required_pointer_parameters = filter(lambda parameter: not parameter.is_optional and ObjCGenerator.is_type_objc_pointer_type(parameter.type), command.return_parameters)
-            for parameter in required_pointer_parameters:
-                var_name = ObjCGenerator.identifier_to_objc_identifier(parameter.parameter_name)
-                lines.append('        THROW_EXCEPTION_FOR_REQUIRED_PARAMETER(%s, @"%s");' % (var_name, var_name))
-                objc_array_class = ObjCGenerator.objc_class_for_array_type(parameter.type)
-                if objc_array_class and objc_array_class.startswith(ObjCGenerator.OBJC_PREFIX):
-                    lines.append('        THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(%s, [%s class]);' % (var_name, objc_array_class))
-
-            optional_pointer_parameters = filter(lambda parameter: parameter.is_optional and ObjCGenerator.is_type_objc_pointer_type(parameter.type), command.return_parameters)
-            for parameter in optional_pointer_parameters:
-                var_name = ObjCGenerator.identifier_to_objc_identifier(parameter.parameter_name)
-                lines.append('        THROW_EXCEPTION_FOR_BAD_OPTIONAL_PARAMETER(%s, @"%s");' % (var_name, var_name))
-                objc_array_class = ObjCGenerator.objc_class_for_array_type(parameter.type)
-                if objc_array_class and objc_array_class.startswith(ObjCGenerator.OBJC_PREFIX):
-                    lines.append('        THROW_EXCEPTION_FOR_BAD_TYPE_IN_OPTIONAL_ARRAY(%s, [%s class]);' % (var_name, objc_array_class))
+            write('        Ref<InspectorObject> resultObject = InspectorObject::create();\n')
 
+            # Classify each parameter once; the output groups required checks,
+            # then optional checks, then the value emits.
+            required_checks = []
+            optional_checks = []
+            emits = []
             for parameter in command.return_parameters:
+                var_name = objc_identifier(parameter.parameter_name)
+                if is_objc_pointer_type(parameter.type):
+                    checks = optional_checks if parameter.is_optional else required_checks
+                    if parameter.is_optional:
+                        checks.append('        THROW_EXCEPTION_FOR_BAD_OPTIONAL_PARAMETER(%s, @"%s");\n' % (var_name, var_name))
+                        array_check = '        THROW_EXCEPTION_FOR_BAD_TYPE_IN_OPTIONAL_ARRAY(%s, [%s class]);\n'
+                    else:
+                        checks.append('        THROW_EXCEPTION_FOR_REQUIRED_PARAMETER(%s, @"%s");\n' % (var_name, var_name))
+                        array_check = '        THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(%s, [%s class]);\n'
+                    objc_array_class = objc_array_class_for_type(parameter.type)
+                    if objc_array_class and objc_array_class.startswith(objc_prefix):
+                        checks.append(array_check % (var_name, objc_array_class))
+
                 keyed_set_method = CppGenerator.cpp_setter_method_for_type(parameter.type)
-                var_name = ObjCGenerator.identifier_to_objc_identifier(parameter.parameter_name)
                 var_expression = '*%s' % var_name if parameter.is_optional else var_name
                 export_expression = ObjCGenerator.objc_protocol_export_expression_for_variable(parameter.type, var_expression)
                 if not parameter.is_optional:
-                    lines.append('        resultObject->%s(ASCIILiteral("%s"), %s);' % (keyed_set_method, parameter.parameter_name, export_expression))
+                    emits.append('        resultObject->%s(ASCIILiteral("%s"), %s);\n' % (keyed_set_method, parameter.parameter_name, export_expression))
                 else:
-                    lines.append('        if (%s)' % var_name)
-                    lines.append('            resultObject->%s(ASCIILiteral("%s"), %s);' % (keyed_set_method, parameter.parameter_name, export_expression))
-            lines.append('        backendDispatcher()->sendResponse(requestId, WTFMove(resultObject));')
+                    emits.append('        if (%s)\n' % var_name)
+                    emits.append('            resultObject->%s(ASCIILiteral("%s"), %s);\n' % (keyed_set_method, parameter.parameter_name, export_expression))
+
+            write(''.join(required_checks))
+            write(''.join(optional_checks))
+            write(''.join(emits))
+            write('        backendDispatcher()->sendResponse(requestId, WTFMove(resultObject));\n')
         else:
-            lines.append('        backendDispatcher()->sendResponse(requestId, InspectorObject::create());')
+            write('        backendDispatcher()->sendResponse(requestId, InspectorObject::create());\n')
 
-        lines.append('    };')
-        return '\n'.join(lines)
+        write('    };')
+        return buf.getvalue()
 
     def _generate_conversions_for_command(self, domain, command):
         lines = []
         if command.call_parameters:
             lines.append('')
 
-        def in_param_expression(param_name, parameter):
-            _type = parameter.type
-            if isinstance(_type, AliasedType):
-                _type = _type.aliased_type  # Fall through to enum or primitive.
-            if isinstance(_type, EnumType):
-                _type = _type.primitive_type  # Fall through to primitive.
-            if isinstance(_type, PrimitiveType):
-                if _type.raw_name() in ['array', 'any', 'object']:
-                    return '&%s' % param_name if not parameter.is_optional else param_name
-                return '*%s' % param_name if parameter.is_optional else param_name
-            return '&%s' % param_name if not parameter.is_optional else param_name
-
         for parameter in command.call_parameters:
             in_param_name = 'in_%s' % parameter.parameter_name
             objc_in_param_name = 'o_%s' % in_param_name
             objc_type = ObjCGenerator.objc_type_for_param(domain, command.command_name, parameter, False)
-            param_expression = in_param_expression(in_param_name, parameter)
+            param_expression = _in_param_expression(in_param_name, parameter)
             import_expression = ObjCGenerator.objc_protocol_import_expression_for_parameter(param_expression, domain, command.command_name, parameter)
             if not parameter.is_optional:
                 lines.append('    %s = %s;' % (join_type_and_name(objc_type, objc_in_param_name), import_expression))
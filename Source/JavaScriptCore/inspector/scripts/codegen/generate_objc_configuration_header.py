@@ -49,13 +49,15 @@ class ObjCConfigurationHeaderGenerator(Generator):
         ]
 
         header_args = {
-            'includes': '\n'.join(['#import ' + header for header in headers]),
+            'includes': '\n'.join('#import ' + header for header in headers),
         }
 
-        self._command_filter = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
-        self._event_filter = ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model())
-
         domains = self.domains_to_generate()
+        # Categorize each domain once instead of re-running the filters per property.
+        command_filter = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
+        event_filter = ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model())
+        self._command_domains = set(domain for domain in domains if domain.commands and command_filter(domain))
+        self._event_domains = set(domain for domain in domains if domain.events and event_filter(domain))
         sections = []
         sections.append(self.generate_license())
         sections.append(Template(ObjCTemplates.GenericHeaderPrelude).substitute(None, **header_args))
@@ -80,8 +82,8 @@ class ObjCConfigurationHeaderGenerator(Generator):
         }
 
         lines = []
-        if domain.commands and self._command_filter(domain):
+        if domain in self._command_domains:
             lines.append(Template(ObjCTemplates.ConfigurationCommandProperty).substitute(None, **property_args))
-        if domain.events and self._event_filter(domain):
+        if domain in self._event_domains:
             lines.append(Template(ObjCTemplates.ConfigurationEventProperty).substitute(None, **property_args))
         return lines
@@ -35,6 +35,25 @@ from objc_generator_templates import ObjCGeneratorTemplates as ObjCTemplates
 
 log = logging.getLogger('global')
 
+# Parsing a Template is not cheap, so only do it once per process.
+_IMPLEMENTATION_PRELUDE_TEMPLATE = Template(ObjCTemplates.ImplementationPrelude)
+_IMPLEMENTATION_POSTLUDE_TEMPLATE = Template(ObjCTemplates.ImplementationPostlude)
+_COMMAND_PROPERTY_IMPLEMENTATION_TEMPLATE = Template(ObjCTemplates.ConfigurationCommandPropertyImplementation)
+_GETTER_IMPLEMENTATION_TEMPLATE = Template(ObjCTemplates.ConfigurationGetterImplementation)
+
+# This block is identical for every model, so join it once at import time.
+_INIT_WITH_CONTROLLER_BLOCK = '\n'.join([
+    '- (instancetype)initWithController:(AugmentableInspectorController*)controller',
+    '{',
+    '    self = [super init];',
+    '    if (!self)',
+    '        return nil;',
+    '    ASSERT(controller);',
+    '    _controller = controller;',
+    '    return self;',
+    '}',
+])
+
 
 class ObjCBackendDispatcherImplementationGenerator(Generator):
     def __init__(self, model, input_filepath):
@@ -55,18 +74,20 @@ class ObjCBackendDispatcherImplementationGenerator(Generator):
 
         header_args = {
             'primaryInclude': '"%sConfiguration.h"' % ObjCGenerator.OBJC_PREFIX,
-            'secondaryIncludes': '\n'.join(['#import %s' % header for header in secondary_headers]),
+            'secondaryIncludes': '\n'.join('#import %s' % header for header in secondary_headers),
         }
 
-        self._command_filter = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
-        self._event_filter = ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model())
-
         domains = self.domains_to_generate()
+        # Categorize each domain once instead of re-running the filters in every pass.
+        command_filter = ObjCGenerator.should_generate_domain_command_handler_filter(self.model())
+        event_filter = ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model())
+        self._command_domains = set(domain for domain in domains if domain.commands and command_filter(domain))
+        self._event_domains = set(domain for domain in domains if domain.events and event_filter(domain))
         sections = []
         sections.append(self.generate_license())
-        sections.append(Template(ObjCTemplates.ImplementationPrelude).substitute(None, **header_args))
+        sections.append(_IMPLEMENTATION_PRELUDE_TEMPLATE.substitute(header_args))
         sections.append(self._generate_configuration_implementation_for_domains(domains))
-        sections.append(Template(ObjCTemplates.ImplementationPostlude).substitute(None, **header_args))
+        sections.append(_IMPLEMENTATION_POSTLUDE_TEMPLATE.substitute(header_args))
         return '\n\n'.join(sections)
 
     def _generate_configuration_implementation_for_domains(self, domains):
@@ -74,56 +95,53 @@ class ObjCBackendDispatcherImplementationGenerator(Generator):
         lines.append('@implementation %sConfiguration' % ObjCGenerator.OBJC_PREFIX)
         lines.append('{')
         lines.append('    AugmentableInspectorController* _controller;')
-        lines.extend(self._generate_ivars(domains))
+        self._generate_ivars(lines, domains)
         lines.append('}')
         lines.append('')
-        lines.append('- (instancetype)initWithController:(AugmentableInspectorController*)controller')
-        lines.append('{')
-        lines.append('    self = [super init];')
-        lines.append('    if (!self)')
-        lines.append('        return nil;')
-        lines.append('    ASSERT(controller);')
-        lines.append('    _controller = controller;')
-        lines.append('    return self;')
-        lines.append('}')
+        lines.append(_INIT_WITH_CONTROLLER_BLOCK)
         lines.append('')
-        lines.extend(self._generate_dealloc(domains))
+        self._generate_dealloc(lines, domains)
         lines.append('')
         for domain in domains:
-            if domain.commands and self._command_filter(domain):
+            if domain in self._command_domains:
                 lines.append(self._generate_handler_setter_for_domain(domain))
                 lines.append('')
-            if domain.events and self._event_filter(domain):
+            if domain in self._event_domains:
                 lines.append(self._generate_event_dispatcher_getter_for_domain(domain))
                 lines.append('')
         lines.append('@end')
         return '\n'.join(lines)
 
-    def _generate_ivars(self, domains):
-        lines = []
+    def _generate_ivars(self, lines, domains):
+        append = lines.append
+        objc_prefix = ObjCGenerator.OBJC_PREFIX
+        variable_name_prefix = ObjCGenerator.variable_name_prefix_for_domain
+        command_domains = self._command_domains
+        event_domains = self._event_domains
         for domain in domains:
-            if domain.commands and self._command_filter(domain):
-                objc_class_name = '%s%sDomainHandler' % (ObjCGenerator.OBJC_PREFIX, domain.domain_name)
-                ivar_name = '_%sHandler' % ObjCGenerator.variable_name_prefix_for_domain(domain)
-                lines.append('    id<%s> %s;' % (objc_class_name, ivar_name))
-            if domain.events and self._event_filter(domain):
-                objc_class_name = '%s%sDomainEventDispatcher' % (ObjCGenerator.OBJC_PREFIX, domain.domain_name)
-                ivar_name = '_%sEventDispatcher' % ObjCGenerator.variable_name_prefix_for_domain(domain)
-                lines.append('    %s *%s;' % (objc_class_name, ivar_name))
-        return lines
-
-    def _generate_dealloc(self, domains):
-        lines = []
-        lines.append('- (void)dealloc')
-        lines.append('{')
+            if domain in command_domains:
+                objc_class_name = '%s%sDomainHandler' % (objc_prefix, domain.domain_name)
+                ivar_name = '_%sHandler' % variable_name_prefix(domain)
+                append('    id<%s> %s;' % (objc_class_name, ivar_name))
+            if domain in event_domains:
+                objc_class_name = '%s%sDomainEventDispatcher' % (objc_prefix, domain.domain_name)
+                ivar_name = '_%sEventDispatcher' % variable_name_prefix(domain)
+                append('    %s *%s;' % (objc_class_name, ivar_name))
+
+    def _generate_dealloc(self, lines, domains):
+        append = lines.append
+        variable_name_prefix = ObjCGenerator.variable_name_prefix_for_domain
+        command_domains = self._command_domains
+        event_domains = self._event_domains
+        append('- (void)dealloc')
+        append('{')
         for domain in domains:
-            if domain.commands and self._command_filter(domain):
-                lines.append('    [_%sHandler release];' % ObjCGenerator.variable_name_prefix_for_domain(domain))
-            if domain.events and self._event_filter(domain):
-                lines.append('    [_%sEventDispatcher release];' % ObjCGenerator.variable_name_prefix_for_domain(domain))
-        lines.append('    [super dealloc];')
-        lines.append('}')
-        return lines
+            if domain in command_domains:
+                append('    [_%sHandler release];' % variable_name_prefix(domain))
+            if domain in event_domains:
+                append('    [_%sEventDispatcher release];' % variable_name_prefix(domain))
+        append('    [super dealloc];')
+        append('}')
 
     def _generate_handler_setter_for_domain(self, domain):
         setter_args = {
@@ -131,7 +149,7 @@ class ObjCBackendDispatcherImplementationGenerator(Generator):
             'domainName': domain.domain_name,
             'variableNamePrefix': ObjCGenerator.variable_name_prefix_for_domain(domain),
         }
-        return Template(ObjCTemplates.ConfigurationCommandPropertyImplementation).substitute(None, **setter_args)
+        return _COMMAND_PROPERTY_IMPLEMENTATION_TEMPLATE.substitute(setter_args)
 
     def _generate_event_dispatcher_getter_for_domain(self, domain):
         getter_args = {
@@ -139,7 +157,7 @@ class ObjCBackendDispatcherImplementationGenerator(Generator):
             'domainName': domain.domain_name,
             'variableNamePrefix': ObjCGenerator.variable_name_prefix_for_domain(domain),
         }
-        return Template(ObjCTemplates.ConfigurationGetterImplementation).substitute(None, **getter_args)
+        return _GETTER_IMPLEMENTATION_TEMPLATE.substitute(getter_args)
 
     def _variable_name_prefix_for_domain(self, domain):
         domain_name = domain.domain_name
@@ -51,7 +51,10 @@ class ObjCConversionHelpersGenerator(Generator):
         return '%sEnumConversionHelpers.h' % ObjCGenerator.OBJC_PREFIX
 
     def domains_to_generate(self):
-        return filter(ObjCGenerator.should_generate_domain_types_filter(self.model()), Generator.domains_to_generate(self))
+        if not hasattr(self, "_filtered_domains_to_generate"):
+            should_generate = ObjCGenerator.should_generate_domain_types_filter(self.model())
+            self._filtered_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate(domain)]
+        return self._filtered_domains_to_generate
 
     def generate_output(self):
         headers = [
@@ -59,7 +62,7 @@ class ObjCConversionHelpersGenerator(Generator):
         ]
 
         header_args = {
-            'includes': '\n'.join(['#import ' + header for header in headers]),
+            'includes': '\n'.join('#import ' + header for header in headers),
         }
 
         domains = self.domains_to_generate()
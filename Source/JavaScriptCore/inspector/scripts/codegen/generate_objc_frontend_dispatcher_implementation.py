@@ -45,7 +45,10 @@ class ObjCFrontendDispatcherImplementationGenerator(Generator):
         return '%sEventDispatchers.mm' % ObjCGenerator.OBJC_PREFIX
 
     def domains_to_generate(self):
-        return filter(ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model()), Generator.domains_to_generate(self))
+        if not hasattr(self, "_filtered_domains_to_generate"):
+            should_generate = ObjCGenerator.should_generate_domain_event_dispatcher_filter(self.model())
+            self._filtered_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate(domain)]
+        return self._filtered_domains_to_generate
 
     def generate_output(self):
         secondary_headers = [
@@ -55,7 +58,7 @@ class ObjCFrontendDispatcherImplementationGenerator(Generator):
 
         header_args = {
             'primaryInclude': '"%sInternal.h"' % ObjCGenerator.OBJC_PREFIX,
-            'secondaryIncludes': '\n'.join(['#import %s' % header for header in secondary_headers]),
+            'secondaryIncludes': '\n'.join('#import %s' % header for header in secondary_headers),
         }
 
         domains = self.domains_to_generate()
@@ -56,7 +56,7 @@ class ObjCHeaderGenerator(Generator):
         ])
 
         header_args = {
-            'includes': '\n'.join(['#import ' + header for header in sorted(headers)]),
+            'includes': '\n'.join('#import ' + header for header in sorted(headers)),
         }
 
         domains = self.domains_to_generate()
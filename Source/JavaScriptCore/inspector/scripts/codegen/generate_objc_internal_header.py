@@ -52,7 +52,7 @@ class ObjCInternalHeaderGenerator(Generator):
         ])
 
         header_args = {
-            'includes': '\n'.join(['#import ' + header for header in sorted(headers)]),
+            'includes': '\n'.join('#import ' + header for header in sorted(headers)),
         }
 
         domains = self.domains_to_generate()
@@ -29,6 +29,11 @@ import logging
 import string
 from string import Template
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from io import StringIO
+
 from generator import Generator, ucfirst
 from models import ObjectType
 from objc_generator import ObjCGenerator
@@ -36,11 +41,23 @@ from objc_generator_templates import ObjCGeneratorTemplates as ObjCTemplates
 
 log = logging.getLogger('global')
 
+# Setter and getter bodies have a fixed shape; parse each shape's template
+# once and substitute the per-member fields.
+_SETTER_TEMPLATE = Template('''- (void)set${ucVarName}:(${objcType})${varName}
+{
+    [super ${setterMethod}:${conversionExpression} forKey:@"${memberName}"];
+}''')
+
+_SETTER_WITH_ARRAY_CHECK_TEMPLATE = Template('''- (void)set${ucVarName}:(${objcType})${varName}
+{
+    THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(${varName}, [${arrayClass} class]);
+    [super ${setterMethod}:${conversionExpression} forKey:@"${memberName}"];
+}''')
 
-def add_newline(lines):
-    if lines and lines[-1] == '':
-        return
-    lines.append('')
+_GETTER_TEMPLATE = Template('''- (${objcType})${varName}
+{
+    return ${conversionExpression};
+}''')
 
 
 class ObjCProtocolTypesImplementationGenerator(Generator):
@@ -51,7 +68,10 @@ class ObjCProtocolTypesImplementationGenerator(Generator):
         return '%sTypes.mm' % ObjCGenerator.OBJC_PREFIX
 
     def domains_to_generate(self):
-        return filter(ObjCGenerator.should_generate_domain_types_filter(self.model()), Generator.domains_to_generate(self))
+        if not hasattr(self, "_filtered_domains_to_generate"):
+            should_generate = ObjCGenerator.should_generate_domain_types_filter(self.model())
+            self._filtered_domains_to_generate = [domain for domain in Generator.domains_to_generate(self) if should_generate(domain)]
+        return self._filtered_domains_to_generate
 
     def generate_output(self):
         secondary_headers = [
@@ -62,47 +82,63 @@ class ObjCProtocolTypesImplementationGenerator(Generator):
 
         header_args = {
             'primaryInclude': '"%sInternal.h"' % ObjCGenerator.OBJC_PREFIX,
-            'secondaryIncludes': '\n'.join(['#import %s' % header for header in secondary_headers]),
+            'secondaryIncludes': '\n'.join('#import %s' % header for header in secondary_headers),
         }
 
         domains = self.domains_to_generate()
-        sections = []
-        sections.append(self.generate_license())
-        sections.append(Template(ObjCTemplates.ImplementationPrelude).substitute(None, **header_args))
-        sections.extend(map(self.generate_type_implementations, domains))
-        sections.append(Template(ObjCTemplates.ImplementationPostlude).substitute(None, **header_args))
-        return '\n\n'.join(sections)
-
-    def generate_type_implementations(self, domain):
-        lines = []
+        buf = StringIO()
+        buf.write(self.generate_license())
+        buf.write('\n\n')
+        buf.write(Template(ObjCTemplates.ImplementationPrelude).substitute(None, **header_args))
+        for domain in domains:
+            buf.write('\n\n')
+            self.generate_type_implementations(buf, domain)
+        buf.write('\n\n')
+        buf.write(Template(ObjCTemplates.ImplementationPostlude).substitute(None, **header_args))
+        return buf.getvalue()
+
+    def generate_type_implementations(self, buf, domain):
+        # Each implementation block is preceded by a blank line.
+        first = True
+        generate_type_implementation = self.generate_type_implementation
         for declaration in domain.type_declarations:
             if (isinstance(declaration.type, ObjectType)):
-                add_newline(lines)
-                lines.append(self.generate_type_implementation(domain, declaration))
-        return '\n'.join(lines)
+                buf.write('\n' if first else '\n\n')
+                first = False
+                buf.write(generate_type_implementation(domain, declaration))
 
     def generate_type_implementation(self, domain, declaration):
-        lines = []
-        lines.append('@implementation %s' % ObjCGenerator.objc_name_for_type(declaration.type))
-        required_members = filter(lambda member: not member.is_optional, declaration.type_members)
-        if required_members:
-            lines.append('')
-            lines.append(self._generate_init_method_for_required_members(domain, declaration, required_members))
-        for member in declaration.type_members:
-            lines.append('')
-            lines.append(self._generate_setter_for_member(domain, declaration, member))
-            lines.append('')
-            lines.append(self._generate_getter_for_member(domain, declaration, member))
-        lines.append('')
-        lines.append('@end')
-        return '\n'.join(lines)
-
-    def _generate_init_method_for_required_members(self, domain, declaration, required_members):
+        objc_identifier = ObjCGenerator.identifier_to_objc_identifier
+        objc_type_for_member = ObjCGenerator.objc_type_for_member
+        # Each block is a self-contained chunk; a double newline separates them.
+        blocks = []
+        blocks.append('@implementation %s' % ObjCGenerator.objc_name_for_type(declaration.type))
+        # Resolve each member's ObjC name and type once and share the
+        # results between the init, setter and getter emitters.
+        member_info = [(member, objc_identifier(member.member_name), objc_type_for_member(declaration, member)) for member in declaration.type_members]
+        required_member_info = [info for info in member_info if not info[0].is_optional]
+        if required_member_info:
+            blocks.append(self._generate_init_method_for_required_members(domain, declaration, required_member_info))
+        for info in member_info:
+            blocks.append(self._generate_setter_for_member(domain, declaration, info))
+            blocks.append(self._generate_getter_for_member(domain, declaration, info))
+        blocks.append('@end')
+        return '\n\n'.join(blocks)
+
+    def _generate_init_method_for_required_members(self, domain, declaration, required_member_info):
+        # Build all three sections of the initializer in a single pass
+        # over the precomputed member information.
         pairs = []
-        for member in required_members:
-            objc_type = ObjCGenerator.objc_type_for_member(declaration, member)
-            var_name = ObjCGenerator.identifier_to_objc_identifier(member.member_name)
+        pointer_checks = []
+        assignments = []
+        for member, var_name, objc_type in required_member_info:
             pairs.append('%s:(%s)%s' % (var_name, objc_type, var_name))
+            if ObjCGenerator.is_type_objc_pointer_type(member.type):
+                pointer_checks.append('    THROW_EXCEPTION_FOR_REQUIRED_PROPERTY(%s, @"%s");' % (var_name, var_name))
+                objc_array_class = ObjCGenerator.objc_class_for_array_type(member.type)
+                if objc_array_class and objc_array_class.startswith(ObjCGenerator.OBJC_PREFIX):
+                    pointer_checks.append('    THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(%s, [%s class]);' % (var_name, objc_array_class))
+            assignments.append('    self.%s = %s;' % (var_name, var_name))
         pairs[0] = ucfirst(pairs[0])
         lines = []
         lines.append('- (instancetype)initWith%s;' % ' '.join(pairs))
@@ -112,49 +148,39 @@ class ObjCProtocolTypesImplementationGenerator(Generator):
         lines.append('        return nil;')
         lines.append('')
 
-        required_pointer_members = filter(lambda member: ObjCGenerator.is_type_objc_pointer_type(member.type), required_members)
-        if required_pointer_members:
-            for member in required_pointer_members:
-                var_name = ObjCGenerator.identifier_to_objc_identifier(member.member_name)
-                lines.append('    THROW_EXCEPTION_FOR_REQUIRED_PROPERTY(%s, @"%s");' % (var_name, var_name))
-                objc_array_class = ObjCGenerator.objc_class_for_array_type(member.type)
-                if objc_array_class and objc_array_class.startswith(ObjCGenerator.OBJC_PREFIX):
-                    lines.append('    THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(%s, [%s class]);' % (var_name, objc_array_class))
+        if pointer_checks:
+            lines.extend(pointer_checks)
             lines.append('')
 
-        for member in required_members:
-            var_name = ObjCGenerator.identifier_to_objc_identifier(member.member_name)
-            lines.append('    self.%s = %s;' % (var_name, var_name))
-
+        lines.extend(assignments)
         lines.append('')
         lines.append('    return self;')
         lines.append('}')
         return '\n'.join(lines)
 
-    def _generate_setter_for_member(self, domain, declaration, member):
-        objc_type = ObjCGenerator.objc_type_for_member(declaration, member)
-        var_name = ObjCGenerator.identifier_to_objc_identifier(member.member_name)
-        setter_method = ObjCGenerator.objc_setter_method_for_member(declaration, member)
-        conversion_expression = ObjCGenerator.objc_to_protocol_expression_for_member(declaration, member, var_name)
-        lines = []
-        lines.append('- (void)set%s:(%s)%s' % (ucfirst(var_name), objc_type, var_name))
-        lines.append('{')
+    def _generate_setter_for_member(self, domain, declaration, member_info):
+        member, var_name, objc_type = member_info
+        setter_args = {
+            'varName': var_name,
+            'ucVarName': ucfirst(var_name),
+            'objcType': objc_type,
+            'memberName': member.member_name,
+            'setterMethod': ObjCGenerator.objc_setter_method_for_member(declaration, member),
+            'conversionExpression': ObjCGenerator.objc_to_protocol_expression_for_member(declaration, member, var_name),
+        }
         objc_array_class = ObjCGenerator.objc_class_for_array_type(member.type)
         if objc_array_class and objc_array_class.startswith(ObjCGenerator.OBJC_PREFIX):
-            lines.append('    THROW_EXCEPTION_FOR_BAD_TYPE_IN_ARRAY(%s, [%s class]);' % (var_name, objc_array_class))
-        lines.append('    [super %s:%s forKey:@"%s"];' % (setter_method, conversion_expression, member.member_name))
-        lines.append('}')
-        return '\n'.join(lines)
+            setter_args['arrayClass'] = objc_array_class
+            return _SETTER_WITH_ARRAY_CHECK_TEMPLATE.substitute(setter_args)
+        return _SETTER_TEMPLATE.substitute(setter_args)
 
-    def _generate_getter_for_member(self, domain, declaration, member):
-        objc_type = ObjCGenerator.objc_type_for_member(declaration, member)
-        var_name = ObjCGenerator.identifier_to_objc_identifier(member.member_name)
+    def _generate_getter_for_member(self, domain, declaration, member_info):
+        member, var_name, objc_type = member_info
         getter_method = ObjCGenerator.objc_getter_method_for_member(declaration, member)
         basic_expression = '[super %s:@"%s"]' % (getter_method, member.member_name)
-        conversion_expression = ObjCGenerator.protocol_to_objc_expression_for_member(declaration, member, basic_expression)
-        lines = []
-        lines.append('- (%s)%s' % (objc_type, var_name))
-        lines.append('{')
-        lines.append('    return %s;' % conversion_expression)
-        lines.append('}')
-        return '\n'.join(lines)
+        getter_args = {
+            'varName': var_name,
+            'objcType': objc_type,
+            'conversionExpression': ObjCGenerator.protocol_to_objc_expression_for_member(declaration, member, basic_expression),
+        }
+        return _GETTER_TEMPLATE.substitute(getter_args)
@@ -39,6 +39,22 @@ def ucfirst(str):
     return str[:1].upper() + str[1:]
 
 _ALWAYS_UPPERCASED_ENUM_VALUE_SUBSTRINGS = set(['API', 'CSS', 'DOM', 'HTML', 'JIT', 'XHR', 'XML'])
+_ALWAYS_UPPERCASED_ENUM_VALUE_REGEX = re.compile('(%s)' % '|'.join(_ALWAYS_UPPERCASED_ENUM_VALUE_SUBSTRINGS), re.IGNORECASE)
+
+# The same enum values show up on type declarations, anonymous enums and
+# parameters across domains, so memoize their stylized forms.
+_STYLIZED_ENUM_VALUE_CACHE = {}
+
+# The same parameter types recur across commands, so memoize their JS names.
+_JS_NAME_FOR_PARAMETER_TYPE_CACHE = {}
+
+# Primitive protocol names whose JS-facing name differs from the raw name.
+_JS_NAME_FOR_PRIMITIVE_NAME_MAP = {
+    'object': 'object',
+    'any': 'object',
+    'integer': 'number',
+    'number': 'number',
+}
 
 # These objects are built manually by creating and setting InspectorValues.
 # Before sending these over the protocol, their shapes are checked against the specification.
@@ -74,23 +90,44 @@ _TYPES_WITH_OPEN_FIELDS = set([
 ])
 
 
+# The copyright block only varies by input filename, so render it at most
+# once per input file even when several generators share a process.
+_COPYRIGHT_BLOCK_TEMPLATE = Template(Templates.CopyrightBlock)
+_LICENSE_CACHE = {}
+
+
 class Generator:
     def __init__(self, model, input_filepath):
         self._model = model
         self._input_filepath = input_filepath
+        # Lazily computed caches; None until first use so the hot accessors
+        # can test an attribute read instead of calling hasattr.
+        self._domains_to_generate = None
+        self._assigned_enum_values = None
+        self._enum_value_encodings = None
+        self._types_needing_shape_assertions = None
 
     def model(self):
         return self._model
 
     def generate_license(self):
-        return Template(Templates.CopyrightBlock).substitute(None, inputFilename=os.path.basename(self._input_filepath))
+        input_filename = os.path.basename(self._input_filepath)
+        try:
+            return _LICENSE_CACHE[input_filename]
+        except KeyError:
+            license = _COPYRIGHT_BLOCK_TEMPLATE.substitute(None, inputFilename=input_filename)
+            _LICENSE_CACHE[input_filename] = license
+            return license
 
     # These methods are overridden by subclasses.
     def non_supplemental_domains(self):
         return filter(lambda domain: not domain.is_supplemental, self.model().domains)
 
     def domains_to_generate(self):
-        return self.non_supplemental_domains()
+        if self._domains_to_generate is None:
+            self._domains_to_generate = list(self.non_supplemental_domains())
+
+        return self._domains_to_generate
 
     def generate_output(self):
         pass
@@ -99,13 +136,13 @@ class Generator:
         pass
 
     def encoding_for_enum_value(self, enum_value):
-        if not hasattr(self, "_assigned_enum_values"):
+        if self._assigned_enum_values is None:
             self._traverse_and_assign_enum_values()
 
         return self._enum_value_encodings[enum_value]
 
     def assigned_enum_values(self):
-        if not hasattr(self, "_assigned_enum_values"):
+        if self._assigned_enum_values is None:
             self._traverse_and_assign_enum_values()
 
         return self._assigned_enum_values[:]  # Slice.
@@ -119,7 +156,7 @@ class Generator:
         return _type.qualified_name() in _TYPES_WITH_OPEN_FIELDS
 
     def type_needs_shape_assertions(self, _type):
-        if not hasattr(self, "_types_needing_shape_assertions"):
+        if self._types_needing_shape_assertions is None:
             self.calculate_types_requiring_shape_assertions(self.model().domains)
 
         return _type in self._types_needing_shape_assertions
@@ -132,23 +169,26 @@ class Generator:
         domain_names = map(lambda domain: domain.domain_name, domains)
         log.debug("> Calculating types that need shape assertions (eligible domains: %s)" % ", ".join(domain_names))
 
-        # Mutates the passed-in set; this simplifies checks to prevent infinite recursion.
-        def gather_transitively_referenced_types(_type, gathered_types):
-            if _type in gathered_types:
-                return
-
-            if isinstance(_type, ObjectType):
-                log.debug("> Adding type %s to list of types needing shape assertions." % _type.qualified_name())
-                gathered_types.add(_type)
-                for type_member in _type.members:
-                    gather_transitively_referenced_types(type_member.type, gathered_types)
-            elif isinstance(_type, EnumType):
-                log.debug("> Adding type %s to list of types needing shape assertions." % _type.qualified_name())
-                gathered_types.add(_type)
-            elif isinstance(_type, AliasedType):
-                gather_transitively_referenced_types(_type.aliased_type, gathered_types)
-            elif isinstance(_type, ArrayType):
-                gather_transitively_referenced_types(_type.element_type, gathered_types)
+        # Mutates the passed-in set; this simplifies checks to prevent revisiting types.
+        # An explicit worklist is used so deep type graphs cannot hit the recursion limit.
+        def gather_transitively_referenced_types(root_type, gathered_types):
+            worklist = [root_type]
+            while worklist:
+                _type = worklist.pop()
+                if _type in gathered_types:
+                    continue
+
+                if isinstance(_type, ObjectType):
+                    log.debug("> Adding type %s to list of types needing shape assertions." % _type.qualified_name())
+                    gathered_types.add(_type)
+                    worklist.extend(type_member.type for type_member in _type.members)
+                elif isinstance(_type, EnumType):
+                    log.debug("> Adding type %s to list of types needing shape assertions." % _type.qualified_name())
+                    gathered_types.add(_type)
+                elif isinstance(_type, AliasedType):
+                    worklist.append(_type.aliased_type)
+                elif isinstance(_type, ArrayType):
+                    worklist.append(_type.element_type)
 
         found_types = set()
         for domain in domains:
@@ -182,17 +222,16 @@ class Generator:
                 all_types.extend([parameter.type for parameter in command.call_parameters])
                 all_types.extend([parameter.type for parameter in command.return_parameters])
 
+        enum_value_encodings = self._enum_value_encodings
+        assigned_enum_values = self._assigned_enum_values
         for _type in all_types:
             if not isinstance(_type, EnumType):
                 continue
-            map(self._assign_encoding_for_enum_value, _type.enum_values())
-
-    def _assign_encoding_for_enum_value(self, enum_value):
-        if enum_value in self._enum_value_encodings:
-            return
-
-        self._enum_value_encodings[enum_value] = len(self._assigned_enum_values)
-        self._assigned_enum_values.append(enum_value)
+            for enum_value in _type.enum_values():
+                if enum_value in enum_value_encodings:
+                    continue
+                enum_value_encodings[enum_value] = len(assigned_enum_values)
+                assigned_enum_values.append(enum_value)
 
     # Miscellaneous text manipulation routines.
     def wrap_with_guard_for_domain(self, domain, text):
@@ -213,29 +252,39 @@ class Generator:
 
     @staticmethod
     def stylized_name_for_enum_value(enum_value):
-        regex = '(%s)' % "|".join(_ALWAYS_UPPERCASED_ENUM_VALUE_SUBSTRINGS)
-
-        def replaceCallback(match):
-            return match.group(1).upper()
-
-        # Split on hyphen, introduce camelcase, and force uppercasing of acronyms.
-        subwords = map(ucfirst, enum_value.split('-'))
-        return re.sub(re.compile(regex, re.IGNORECASE), replaceCallback, "".join(subwords))
+        try:
+            return _STYLIZED_ENUM_VALUE_CACHE[enum_value]
+        except KeyError:
+            def replaceCallback(match):
+                return match.group(1).upper()
+
+            # Split on hyphen, introduce camelcase, and force uppercasing of acronyms.
+            camel_cased = "".join([ucfirst(subword) for subword in enum_value.split('-')])
+            result = _ALWAYS_UPPERCASED_ENUM_VALUE_REGEX.sub(replaceCallback, camel_cased)
+            _STYLIZED_ENUM_VALUE_CACHE[enum_value] = result
+            return result
 
     @staticmethod
     def js_name_for_parameter_type(_type):
-        _type = _type
-        if isinstance(_type, AliasedType):
+        try:
+            return _JS_NAME_FOR_PARAMETER_TYPE_CACHE[_type]
+        except KeyError:
+            result = Generator._js_name_for_parameter_type(_type)
+            _JS_NAME_FOR_PARAMETER_TYPE_CACHE[_type] = result
+            return result
+
+    @staticmethod
+    def _js_name_for_parameter_type(_type):
+        cls = _type.__class__
+        if cls is AliasedType:
             _type = _type.aliased_type  # Fall through.
-        if isinstance(_type, EnumType):
+            cls = _type.__class__
+        if cls is EnumType:
             _type = _type.primitive_type  # Fall through.
+            cls = _type.__class__
 
-        if isinstance(_type, (ArrayType, ObjectType)):
+        if cls is ArrayType or cls is ObjectType:
             return 'object'
-        if isinstance(_type, PrimitiveType):
-            if _type.qualified_name() in ['object', 'any']:
-                return 'object'
-            elif _type.qualified_name() in ['integer', 'number']:
-                return 'number'
-            else:
-                return _type.qualified_name()
+        if cls is PrimitiveType:
+            name = _type.qualified_name()
+            return _JS_NAME_FOR_PRIMITIVE_NAME_MAP.get(name, name)
@@ -180,7 +180,12 @@ class AliasedType(Type):
         return self._domain
 
     def qualified_name(self):
-        return  ".".join([self.type_domain().domain_name, self.raw_name()])
+        # The name never changes once type references are resolved, so build it once.
+        try:
+            return self._qualified_name
+        except AttributeError:
+            self._qualified_name = ".".join([self.type_domain().domain_name, self.raw_name()])
+            return self._qualified_name
 
     def resolve_type_references(self, protocol):
         if self.aliased_type is not None:
@@ -212,7 +217,12 @@ class EnumType(Type):
         return self._values
 
     def qualified_name(self):
-        return  ".".join([self.type_domain().domain_name, self.raw_name()])
+        # The name never changes once type references are resolved, so build it once.
+        try:
+            return self._qualified_name
+        except AttributeError:
+            self._qualified_name = ".".join([self.type_domain().domain_name, self.raw_name()])
+            return self._qualified_name
 
     def resolve_type_references(self, protocol):
         if self.primitive_type is not None:
@@ -240,7 +250,11 @@ class ArrayType(Type):
         return self._domain
 
     def qualified_name(self):
-        return  ".".join(["array", self.element_type.qualified_name()])
+        try:
+            return self._qualified_name
+        except AttributeError:
+            self._qualified_name = ".".join(["array", self.element_type.qualified_name()])
+            return self._qualified_name
 
     def resolve_type_references(self, protocol):
         if self.element_type is not None:
@@ -263,7 +277,12 @@ class ObjectType(Type):
         return self._domain
 
     def qualified_name(self):
-        return  ".".join([self.type_domain().domain_name, self.raw_name()])
+        # The name never changes once type references are resolved, so build it once.
+        try:
+            return self._qualified_name
+        except AttributeError:
+            self._qualified_name = ".".join([self.type_domain().domain_name, self.raw_name()])
+            return self._qualified_name
 
 
 def check_for_required_properties(props, obj, what):
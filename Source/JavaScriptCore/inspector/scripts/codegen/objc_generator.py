@@ -37,11 +37,19 @@ def join_type_and_name(type_str, name_str):
 
 
 def strip_block_comment_markers(str):
+    # Only nested NSArray class names carry comment markers; skip the two
+    # replaces for everything else.
+    if '/*' not in str:
+        return str
     return str.replace('/*', '').replace('*/', '')
 
 
 def remove_duplicate_from_str(str, possible_duplicate):
-    return str.replace(possible_duplicate + possible_duplicate, possible_duplicate)
+    # The duplicate is rare, so check for it before paying for a replace.
+    duplicated = possible_duplicate + possible_duplicate
+    if duplicated not in str:
+        return str
+    return str.replace(duplicated, possible_duplicate)
 
 
 _OBJC_IDENTIFIER_RENAME_MAP = {
@@ -50,7 +58,114 @@ _OBJC_IDENTIFIER_RENAME_MAP = {
     'id': 'identifier',  # Page.Frame.id, Runtime.ExecutionContextDescription.id, Debugger.BreakpointAction.id
 }
 
-_OBJC_IDENTIFIER_REVERSE_RENAME_MAP = dict((v, k) for k, v in _OBJC_IDENTIFIER_RENAME_MAP.iteritems())
+_OBJC_IDENTIFIER_REVERSE_RENAME_MAP = {v: k for k, v in _OBJC_IDENTIFIER_RENAME_MAP.iteritems()}
+
+
+# Module-level so the hot per-identifier callers can bind these directly
+# without a staticmethod descriptor lookup.
+def _identifier_to_objc_identifier(name):
+    return _OBJC_IDENTIFIER_RENAME_MAP.get(name, name)
+
+
+def _objc_identifier_to_identifier(name):
+    return _OBJC_IDENTIFIER_REVERSE_RENAME_MAP.get(name, name)
+
+_OBJC_PREFIX = 'RWIProtocol'
+_OBJC_JSON_OBJECT_BASE = '%sJSONObject' % _OBJC_PREFIX
+
+# Flat lookup tables for the primitive protocol type names. A single dict
+# probe replaces the old compare-and-branch chains (which also leaned on
+# fragile 'is' comparisons against interned literals).
+_RAW_NAME_TO_OBJC_ACCESSOR_TYPE = {
+    'string': 'copy',
+    'array': 'copy',
+    'integer': 'assign',
+    'number': 'assign',
+    'boolean': 'assign',
+    'any': 'retain',
+    'object': 'retain',
+}
+
+_RAW_NAME_TO_OBJC_TYPE = {
+    'string': 'NSString *',
+    'array': 'NSArray *',
+    'integer': 'int',
+    'number': 'double',
+    'boolean': 'BOOL',
+    'any': '%s *' % _OBJC_JSON_OBJECT_BASE,
+    'object': '%s *' % _OBJC_JSON_OBJECT_BASE,
+}
+
+_RAW_NAME_TO_OBJC_CLASS = {
+    'string': 'NSString',
+    'array': 'NSArray',
+    'integer': 'NSNumber',
+    'number': 'NSNumber',
+    'boolean': 'NSNumber',
+    'any': _OBJC_JSON_OBJECT_BASE,
+    'object': _OBJC_JSON_OBJECT_BASE,
+}
+
+_RAW_NAME_TO_PROTOCOL_TYPE = {
+    'string': 'String',
+    'integer': 'int',
+    'number': 'double',
+    'boolean': 'bool',
+    'any': 'InspectorObject',
+    'object': 'InspectorObject',
+}
+
+_RAW_NAME_TO_SETTER_METHOD = {
+    'boolean': 'setBool',
+    'integer': 'setInteger',
+    'number': 'setDouble',
+    'string': 'setString',
+    'any': 'setObject',
+    'object': 'setObject',
+    'array': 'setInspectorArray',
+}
+
+_RAW_NAME_TO_GETTER_METHOD = {
+    'boolean': 'boolForKey',
+    'integer': 'integerForKey',
+    'number': 'doubleForKey',
+    'string': 'stringForKey',
+    'any': 'objectForKey',
+    'object': 'objectForKey',
+    'array': 'inspectorArrayForKey',
+}
+
+# Type -> ObjCTypeCategory, filled in as categories are first computed.
+_OBJC_TYPE_CATEGORY_CACHE = {}
+
+# Tags for the resolved (alias-free) kind of a type, so the helpers below
+# can unwrap and classify once instead of repeating the isinstance ladder.
+_TAG_PRIMITIVE, _TAG_ENUM, _TAG_OBJECT, _TAG_ARRAY = range(4)
+
+_CLASS_TO_TYPE_TAG = {
+    PrimitiveType: _TAG_PRIMITIVE,
+    EnumType: _TAG_ENUM,
+    ObjectType: _TAG_OBJECT,
+    ArrayType: _TAG_ARRAY,
+}
+
+
+def _resolve_and_classify(_type):
+    while isinstance(_type, AliasedType):
+        _type = _type.aliased_type
+    return _type, _CLASS_TO_TYPE_TAG.get(_type.__class__)
+
+# Domain name -> ivar/setter name prefix ('DOMStorage' -> 'domStorage').
+_VARIABLE_NAME_PREFIX_CACHE = {}
+
+# (declaration, member) -> rendered ObjC type, computed on first use.
+_OBJC_TYPE_FOR_MEMBER_CACHE = {}
+
+# Per-type name caches; the same types are resolved for every member and
+# parameter that references them.
+_OBJC_NAME_FOR_TYPE_CACHE = {}
+_OBJC_CLASS_FOR_TYPE_CACHE = {}
+_PROTOCOL_TYPE_FOR_TYPE_CACHE = {}
 
 
 class ObjCTypeCategory:
@@ -61,12 +176,21 @@ class ObjCTypeCategory:
 
     @staticmethod
     def category_for_type(_type):
+        try:
+            return _OBJC_TYPE_CATEGORY_CACHE[_type]
+        except KeyError:
+            category = ObjCTypeCategory._category_for_type(_type)
+            _OBJC_TYPE_CATEGORY_CACHE[_type] = category
+            return category
+
+    @staticmethod
+    def _category_for_type(_type):
         if (isinstance(_type, PrimitiveType)):
-            if _type.raw_name() is 'string':
+            if _type.raw_name() == 'string':
                 return ObjCTypeCategory.String
             if  _type.raw_name() in ['object', 'any']:
                 return ObjCTypeCategory.Object
-            if _type.raw_name() is 'array':
+            if _type.raw_name() == 'array':
                 return ObjCTypeCategory.Array
             return ObjCTypeCategory.Simple
         if (isinstance(_type, ObjectType)):
@@ -85,31 +209,30 @@ class ObjCTypeCategory:
 # not participate in any inheritance hierarchy. File generators should
 # extend the generic "Generator" class instead.
 class ObjCGenerator:
-    OBJC_PREFIX = 'RWIProtocol'
-    OBJC_JSON_OBJECT_BASE = '%sJSONObject' % OBJC_PREFIX
+    OBJC_PREFIX = _OBJC_PREFIX
+    OBJC_JSON_OBJECT_BASE = _OBJC_JSON_OBJECT_BASE
 
     # Adjust identifier names that collide with ObjC keywords.
 
-    @staticmethod
-    def identifier_to_objc_identifier(name):
-        return _OBJC_IDENTIFIER_RENAME_MAP.get(name, name)
-
-    @staticmethod
-    def objc_identifier_to_identifier(name):
-        return _OBJC_IDENTIFIER_REVERSE_RENAME_MAP.get(name, name)
+    identifier_to_objc_identifier = staticmethod(_identifier_to_objc_identifier)
+    objc_identifier_to_identifier = staticmethod(_objc_identifier_to_identifier)
 
     # Generate ObjC types, command handlers, and event dispatchers for a subset of domains.
 
     DOMAINS_TO_GENERATE = ['CSS', 'DOM', 'DOMStorage', 'Network', 'Page', 'GenericTypes']
 
+    # Frozen whitelists, built once; the filter closures below only do a
+    # membership test per domain.
+    _TYPES_DOMAIN_WHITELIST = frozenset(DOMAINS_TO_GENERATE + ['Console', 'Debugger', 'Runtime'])
+    _COMMAND_HANDLER_DOMAIN_WHITELIST = frozenset(DOMAINS_TO_GENERATE)
+    _EVENT_DISPATCHER_DOMAIN_WHITELIST = frozenset(DOMAINS_TO_GENERATE + ['Console'])
+
     @staticmethod
     def should_generate_domain_types_filter(model):
         def should_generate_domain_types(domain):
             if model.framework is Frameworks.Test:
                 return True
-            whitelist = set(ObjCGenerator.DOMAINS_TO_GENERATE)
-            whitelist.update(set(['Console', 'Debugger', 'Runtime']))
-            return domain.domain_name in whitelist
+            return domain.domain_name in ObjCGenerator._TYPES_DOMAIN_WHITELIST
         return should_generate_domain_types
 
     @staticmethod
@@ -117,8 +240,7 @@ class ObjCGenerator:
         def should_generate_domain_command_handler(domain):
             if model.framework is Frameworks.Test:
                 return True
-            whitelist = set(ObjCGenerator.DOMAINS_TO_GENERATE)
-            return domain.domain_name in whitelist
+            return domain.domain_name in ObjCGenerator._COMMAND_HANDLER_DOMAIN_WHITELIST
         return should_generate_domain_command_handler
 
     @staticmethod
@@ -126,163 +248,149 @@ class ObjCGenerator:
         def should_generate_domain_event_dispatcher(domain):
             if model.framework is Frameworks.Test:
                 return True
-            whitelist = set(ObjCGenerator.DOMAINS_TO_GENERATE)
-            whitelist.add('Console')
-            return domain.domain_name in whitelist
+            return domain.domain_name in ObjCGenerator._EVENT_DISPATCHER_DOMAIN_WHITELIST
         return should_generate_domain_event_dispatcher
 
     # ObjC enum and type names.
 
     @staticmethod
     def objc_name_for_type(type):
-        name = type.qualified_name().replace('.', '')
-        name = remove_duplicate_from_str(name, type.type_domain().domain_name)
-        return '%s%s' % (ObjCGenerator.OBJC_PREFIX, name)
+        try:
+            return _OBJC_NAME_FOR_TYPE_CACHE[type]
+        except KeyError:
+            name = type.qualified_name().replace('.', '')
+            name = remove_duplicate_from_str(name, type.type_domain().domain_name)
+            name = ObjCGenerator.OBJC_PREFIX + name
+            _OBJC_NAME_FOR_TYPE_CACHE[type] = name
+            return name
 
     @staticmethod
     def objc_enum_name_for_anonymous_enum_declaration(declaration):
         domain_name = declaration.type.type_domain().domain_name
-        name = '%s%s' % (domain_name, declaration.type.raw_name())
+        name = domain_name + declaration.type.raw_name()
         name = remove_duplicate_from_str(name, domain_name)
-        return '%s%s' % (ObjCGenerator.OBJC_PREFIX, name)
+        return ObjCGenerator.OBJC_PREFIX + name
 
     @staticmethod
     def objc_enum_name_for_anonymous_enum_member(declaration, member):
         domain_name = member.type.type_domain().domain_name
-        name = '%s%s%s' % (domain_name, declaration.type.raw_name(), ucfirst(member.member_name))
+        name = ''.join((domain_name, declaration.type.raw_name(), ucfirst(member.member_name)))
         name = remove_duplicate_from_str(name, domain_name)
-        return '%s%s' % (ObjCGenerator.OBJC_PREFIX, name)
+        return ObjCGenerator.OBJC_PREFIX + name
 
     @staticmethod
     def objc_enum_name_for_anonymous_enum_parameter(domain, event_or_command_name, parameter):
         domain_name = domain.domain_name
-        name = '%s%s%s' % (domain_name, ucfirst(event_or_command_name), ucfirst(parameter.parameter_name))
+        name = ''.join((domain_name, ucfirst(event_or_command_name), ucfirst(parameter.parameter_name)))
         name = remove_duplicate_from_str(name, domain_name)
-        return '%s%s' % (ObjCGenerator.OBJC_PREFIX, name)
+        return ObjCGenerator.OBJC_PREFIX + name
 
     @staticmethod
     def objc_enum_name_for_non_anonymous_enum(_type):
         domain_name = _type.type_domain().domain_name
         name = _type.qualified_name().replace('.', '')
         name = remove_duplicate_from_str(name, domain_name)
-        return '%s%s' % (ObjCGenerator.OBJC_PREFIX, name)
+        return ObjCGenerator.OBJC_PREFIX + name
 
     # Miscellaneous name handling.
 
     @staticmethod
     def variable_name_prefix_for_domain(domain):
         domain_name = domain.domain_name
+        try:
+            return _VARIABLE_NAME_PREFIX_CACHE[domain_name]
+        except KeyError:
+            pass
         if domain_name.startswith('DOM'):
-            return 'dom' + domain_name[3:]
-        if domain_name.startswith('CSS'):
-            return 'css' + domain_name[3:]
-        return domain_name[:1].lower() + domain_name[1:]
+            prefix = 'dom' + domain_name[3:]
+        elif domain_name.startswith('CSS'):
+            prefix = 'css' + domain_name[3:]
+        else:
+            prefix = domain_name[:1].lower() + domain_name[1:]
+        _VARIABLE_NAME_PREFIX_CACHE[domain_name] = prefix
+        return prefix
 
     # Type basics.
 
     @staticmethod
     def objc_accessor_type_for_raw_name(raw_name):
-        if raw_name in ['string', 'array']:
-            return 'copy'
-        if raw_name in ['integer', 'number', 'boolean']:
-            return 'assign'
-        if raw_name in ['any', 'object']:
-            return 'retain'
-        return None
+        return _RAW_NAME_TO_OBJC_ACCESSOR_TYPE.get(raw_name)
 
     @staticmethod
     def objc_type_for_raw_name(raw_name):
-        if raw_name is 'string':
-            return 'NSString *'
-        if raw_name is 'array':
-            return 'NSArray *'
-        if raw_name is 'integer':
-            return 'int'
-        if raw_name is 'number':
-            return 'double'
-        if raw_name is 'boolean':
-            return 'BOOL'
-        if raw_name in ['any', 'object']:
-            return '%s *' % ObjCGenerator.OBJC_JSON_OBJECT_BASE
-        return None
+        return _RAW_NAME_TO_OBJC_TYPE.get(raw_name)
 
     @staticmethod
     def objc_class_for_raw_name(raw_name):
-        if raw_name is 'string':
-            return 'NSString'
-        if raw_name is 'array':
-            return 'NSArray'
-        if raw_name in ['integer', 'number', 'boolean']:
-            return 'NSNumber'
-        if raw_name in ['any', 'object']:
-            return ObjCGenerator.OBJC_JSON_OBJECT_BASE
-        return None
+        return _RAW_NAME_TO_OBJC_CLASS.get(raw_name)
 
     # FIXME: Can these protocol_type functions be removed in favor of C++ generators functions?
 
     @staticmethod
     def protocol_type_for_raw_name(raw_name):
-        if raw_name is 'string':
-            return 'String'
-        if raw_name is 'integer':
-            return 'int'
-        if raw_name is 'number':
-            return 'double'
-        if raw_name is 'boolean':
-            return 'bool'
-        if raw_name in ['any', 'object']:
-            return 'InspectorObject'
-        return None
+        return _RAW_NAME_TO_PROTOCOL_TYPE.get(raw_name)
 
     @staticmethod
     def protocol_type_for_type(_type):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        try:
+            return _PROTOCOL_TYPE_FOR_TYPE_CACHE[_type]
+        except KeyError:
+            protocol_type = ObjCGenerator._protocol_type_for_type(_type)
+            _PROTOCOL_TYPE_FOR_TYPE_CACHE[_type] = protocol_type
+            return protocol_type
+
+    @staticmethod
+    def _protocol_type_for_type(_type):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return ObjCGenerator.protocol_type_for_raw_name(_type.raw_name())
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             return ObjCGenerator.protocol_type_for_type(_type.primitive_type)
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return 'Inspector::Protocol::%s::%s' % (_type.type_domain().domain_name, _type.raw_name())
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             sub_type = ObjCGenerator.protocol_type_for_type(_type.element_type)
             return 'Inspector::Protocol::Array<%s>' % sub_type
         return None
 
     @staticmethod
     def is_type_objc_pointer_type(_type):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return _type.raw_name() in ['string', 'array', 'any', 'object']
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             return False
-        if (isinstance(_type, ObjectType)):
-            return True
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_OBJECT or tag == _TAG_ARRAY:
             return True
         return None
 
     @staticmethod
     def objc_class_for_type(_type):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        try:
+            return _OBJC_CLASS_FOR_TYPE_CACHE[_type]
+        except KeyError:
+            objc_class = ObjCGenerator._objc_class_for_type(_type)
+            _OBJC_CLASS_FOR_TYPE_CACHE[_type] = objc_class
+            return objc_class
+
+    @staticmethod
+    def _objc_class_for_type(_type):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return ObjCGenerator.objc_class_for_raw_name(_type.raw_name())
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             return ObjCGenerator.objc_class_for_raw_name(_type.primitive_type.raw_name())
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return ObjCGenerator.objc_name_for_type(_type)
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             sub_type = strip_block_comment_markers(ObjCGenerator.objc_class_for_type(_type.element_type))
             return 'NSArray/*<%s>*/' % sub_type
         return None
 
     @staticmethod
     def objc_class_for_array_type(_type):
-        if isinstance(_type, AliasedType):
-            _type = _type.aliased_type
-        if isinstance(_type, ArrayType):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_ARRAY:
             return ObjCGenerator.objc_class_for_type(_type.element_type)
         return None
 
@@ -292,35 +400,39 @@ class ObjCGenerator:
 
     @staticmethod
     def objc_accessor_type_for_member_internal(_type):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return ObjCGenerator.objc_accessor_type_for_raw_name(_type.raw_name())
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             return 'assign'
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return 'retain'
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             return 'copy'
         return None
 
     @staticmethod
     def objc_type_for_member(declaration, member):
-        return ObjCGenerator.objc_type_for_member_internal(member.type, declaration, member)
+        key = (declaration, member)
+        try:
+            return _OBJC_TYPE_FOR_MEMBER_CACHE[key]
+        except KeyError:
+            objc_type = ObjCGenerator.objc_type_for_member_internal(member.type, declaration, member)
+            _OBJC_TYPE_FOR_MEMBER_CACHE[key] = objc_type
+            return objc_type
 
     @staticmethod
     def objc_type_for_member_internal(_type, declaration, member):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return ObjCGenerator.objc_type_for_raw_name(_type.raw_name())
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             if (_type.is_anonymous):
                 return ObjCGenerator.objc_enum_name_for_anonymous_enum_member(declaration, member)
             return ObjCGenerator.objc_enum_name_for_non_anonymous_enum(_type)
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return ObjCGenerator.objc_name_for_type(_type) + ' *'
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             sub_type = strip_block_comment_markers(ObjCGenerator.objc_class_for_type(_type.element_type))
             return 'NSArray/*<%s>*/ *' % sub_type
         return None
@@ -336,17 +448,16 @@ class ObjCGenerator:
 
     @staticmethod
     def objc_type_for_param_internal(_type, domain, event_or_command_name, parameter):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
             return ObjCGenerator.objc_type_for_raw_name(_type.raw_name())
-        if (isinstance(_type, EnumType)):
+        if tag == _TAG_ENUM:
             if _type.is_anonymous:
                 return ObjCGenerator.objc_enum_name_for_anonymous_enum_parameter(domain, event_or_command_name, parameter)
             return ObjCGenerator.objc_enum_name_for_non_anonymous_enum(_type)
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return ObjCGenerator.objc_name_for_type(_type) + ' *'
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             sub_type = strip_block_comment_markers(ObjCGenerator.objc_class_for_type(_type.element_type))
             return 'NSArray/*<%s>*/ *' % sub_type
         return None
@@ -370,11 +481,11 @@ class ObjCGenerator:
             objc_class = ObjCGenerator.objc_class_for_type(var_type.element_type)
             if protocol_type == 'Inspector::Protocol::Array<String>':
                 return 'inspectorStringArrayArray(%s)' % var_name
-            if protocol_type is 'String' and objc_class is 'NSString':
+            if protocol_type == 'String' and objc_class == 'NSString':
                 return 'inspectorStringArray(%s)' % var_name
-            if protocol_type is 'int' and objc_class is 'NSNumber':
+            if protocol_type == 'int' and objc_class == 'NSNumber':
                 return 'inspectorIntegerArray(%s)' % var_name
-            if protocol_type is 'double' and objc_class is 'NSNumber':
+            if protocol_type == 'double' and objc_class == 'NSNumber':
                 return 'inspectorDoubleArray(%s)' % var_name
             return 'inspectorObjectArray(%s)' % var_name
 
@@ -404,9 +515,9 @@ class ObjCGenerator:
             return '[[[%s alloc] initWithInspectorObject:%s] autorelease]' % (objc_class, var_name)
         if category is ObjCTypeCategory.Array:
             objc_class = ObjCGenerator.objc_class_for_type(var_type.element_type)
-            if objc_class is 'NSString':
+            if objc_class == 'NSString':
                 return 'objcStringArray(%s)' % var_name
-            if objc_class is 'NSNumber':  # FIXME: Integer or Double?
+            if objc_class == 'NSNumber':  # FIXME: Integer or Double?
                 return 'objcIntegerArray(%s)' % var_name
             return 'objcArray<%s>(%s)' % (objc_class, var_name)
 
@@ -425,11 +536,11 @@ class ObjCGenerator:
             return sub_expression
         if category is ObjCTypeCategory.Array:
             objc_class = ObjCGenerator.objc_class_for_type(member.type.element_type)
-            if objc_class is 'NSString':
+            if objc_class == 'NSString':
                 return 'inspectorStringArray(%s)' % sub_expression
-            if objc_class is 'NSNumber':
+            if objc_class == 'NSNumber':
                 protocol_type = ObjCGenerator.protocol_type_for_type(member.type.element_type)
-                if protocol_type is 'double':
+                if protocol_type == 'double':
                     return 'inspectorDoubleArray(%s)' % sub_expression
                 return 'inspectorIntegerArray(%s)' % sub_expression
             return 'inspectorObjectArray(%s)' % sub_expression
@@ -449,11 +560,11 @@ class ObjCGenerator:
         if category is ObjCTypeCategory.Array:
             protocol_type = ObjCGenerator.protocol_type_for_type(member.type.element_type)
             objc_class = ObjCGenerator.objc_class_for_type(member.type.element_type)
-            if objc_class is 'NSString':
+            if objc_class == 'NSString':
                 return 'objcStringArray(%s)' % sub_expression
-            if objc_class is 'NSNumber':
+            if objc_class == 'NSNumber':
                 protocol_type = ObjCGenerator.protocol_type_for_type(member.type.element_type)
-                if protocol_type is 'double':
+                if protocol_type == 'double':
                     return 'objcDoubleArray(%s)' % sub_expression
                 return 'objcIntegerArray(%s)' % sub_expression
             return 'objcArray<%s>(%s)' % (objc_class, sub_expression)
@@ -466,28 +577,14 @@ class ObjCGenerator:
 
     @staticmethod
     def objc_setter_method_for_member_internal(_type, declaration, member):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
-            raw_name = _type.raw_name()
-            if raw_name is 'boolean':
-                return 'setBool'
-            if raw_name is 'integer':
-                return 'setInteger'
-            if raw_name is 'number':
-                return 'setDouble'
-            if raw_name is 'string':
-                return 'setString'
-            if raw_name in ['any', 'object']:
-                return 'setObject'
-            if raw_name is 'array':
-                return 'setInspectorArray'
-            return None
-        if (isinstance(_type, EnumType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
+            return _RAW_NAME_TO_SETTER_METHOD.get(_type.raw_name())
+        if tag == _TAG_ENUM:
             return 'setString'
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return 'setObject'
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             return 'setInspectorArray'
         return None
 
@@ -497,27 +594,13 @@ class ObjCGenerator:
 
     @staticmethod
     def objc_getter_method_for_member_internal(_type, declaration, member):
-        if (isinstance(_type, AliasedType)):
-            _type = _type.aliased_type
-        if (isinstance(_type, PrimitiveType)):
-            raw_name = _type.raw_name()
-            if raw_name is 'boolean':
-                return 'boolForKey'
-            if raw_name is 'integer':
-                return 'integerForKey'
-            if raw_name is 'number':
-                return 'doubleForKey'
-            if raw_name is 'string':
-                return 'stringForKey'
-            if raw_name in ['any', 'object']:
-                return 'objectForKey'
-            if raw_name is 'array':
-                return 'inspectorArrayForKey'
-            return None
-        if (isinstance(_type, EnumType)):
+        _type, tag = _resolve_and_classify(_type)
+        if tag == _TAG_PRIMITIVE:
+            return _RAW_NAME_TO_GETTER_METHOD.get(_type.raw_name())
+        if tag == _TAG_ENUM:
             return 'stringForKey'
-        if (isinstance(_type, ObjectType)):
+        if tag == _TAG_OBJECT:
             return 'objectForKey'
-        if (isinstance(_type, ArrayType)):
+        if tag == _TAG_ARRAY:
             return 'inspectorArrayForKey'
         return None